@@ -8,20 +8,42 @@ power is used for EV charging instead of depleting the home battery.
 """
 
 import asyncio
+import hmac
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Optional
-from datetime import datetime, timedelta
+import time
+from typing import Dict, List, Optional, Tuple
 import signal
 
+import aiohttp
+from aiohttp import web
 from pymyenergi.connection import Connection
 from pymyenergi.zappi import Zappi
 from sigen import Sigen
 
 
+def _num_or_none(value) -> Optional[float]:
+    """Return value if it is numeric, otherwise None"""
+    return value if isinstance(value, (int, float)) else None
+
+
 class BatterySitter:
     """Coordinates Zappi monitoring and Sigenstore battery control"""
 
+    # Status codes from pymyenergi:
+    # Paused, Charging or Completed
+    CHARGING_STATUSES: frozenset = frozenset({'Charging', 'Boosting'})
+
+    # Upper bound in seconds for the backed-off poll interval while unplugged
+    MAX_IDLE_POLL_INTERVAL = 300
+    # pymyenergi plug status label when no EV is plugged in (PLUG_STATES "A")
+    PLUG_DISCONNECTED = 'EV Disconnected'
+    # Minimum seconds between repeated manual charge enables
+    MIN_REENABLE_INTERVAL = 60
+
     def __init__(
         self,
         # Zappi / MyEnergi credentials
@@ -36,6 +58,11 @@ class BatterySitter:
         charging_power: int = 1,
         # Polling settings
         poll_interval: int = 30,
+        # Push notification settings (falls back to polling if unavailable)
+        use_webhook: bool = False,
+        webhook_port: int = 8089,
+        webhook_host: str = '127.0.0.1',
+        webhook_secret: Optional[str] = None,
     ):
         """
         Initialize BatterySitter
@@ -48,6 +75,10 @@ class BatterySitter:
             sigenergy_password: MySigen app password
             sigenergy_region: Region code (eu, us, cn, apac)
             poll_interval: Seconds between status checks
+            use_webhook: Wait for MyEnergi webhook POSTs instead of polling Zappi
+            webhook_port: Local port the webhook listener binds to
+            webhook_host: Interface the webhook listener binds to
+            webhook_secret: Shared secret expected in the X-Webhook-Secret header
         """
         self.zappi_username = zappi_username
         self.zappi_password = zappi_password
@@ -59,22 +90,61 @@ class BatterySitter:
         self.charging_power = charging_power
 
         self.poll_interval = poll_interval
+        self.use_webhook = use_webhook
+        self.webhook_port = webhook_port
+        self.webhook_host = webhook_host
+        self.webhook_secret = webhook_secret
 
         self.logger = logging.getLogger(__name__)
+        # MyEnergi connection (and its discovered location) is reused across reconnects
+        self._zappi_connection: Optional[Connection] = None
         self.zappi: Optional[Zappi] = None
         self.sigen: Optional[Sigen] = None
+        # Long-lived HTTP session so Sigen PUTs reuse keep-alive connections
+        self._http_session: Optional[aiohttp.ClientSession] = None
         self.is_charging = False
-        self.running = False
+        # Set by shutdown() - wakes the monitor loop immediately. Created inside
+        # the running loop by _get_stop_event(), like the lock below
+        self._stop_event: Optional[asyncio.Event] = None
         self.manual_charge_enabled = False  # Track if WE enabled manual charge
-        self.last_connection_time: Optional[datetime] = None
-        self.reconnect_interval = timedelta(hours=8)  # Reconnect every 8 hours
+        # Serialises manual charge PUTs (e.g. shutdown vs. loop) - created inside
+        # the running loop in connect()
+        self._manual_charge_lock: Optional[asyncio.Lock] = None
+        # When the last enable succeeded - used to rate-limit re-enables
+        self._last_manual_charge_enable_ts: Optional[float] = None
+        # Prebuilt payloads for the usual enable/disable calls - stationId set in connect()
+        self._manual_charge_on_payload = {
+            'enable': True,
+            'stationId': None,
+            'mode': '0',
+            'duration': '30',
+            'powerLimitation': str(charging_power)
+        }
+        self._manual_charge_on_power = charging_power
+        self._manual_charge_off_payload = {
+            'enable': False,
+            'stationId': None,
+            'mode': '0',
+            'duration': '0',
+            'powerLimitation': '0'
+        }
+        self.reconnect_interval = 8 * 3600  # Reconnect every 8 hours (seconds)
+        # time.monotonic() value after which connect() is called again
+        self._reconnect_deadline: float = 0.0
+
+        # Webhook state - event is created inside the running loop in run()
+        self._webhook_runner: Optional[web.AppRunner] = None
+        self._webhook_event: Optional[asyncio.Event] = None
+        self._webhook_charging: Optional[bool] = None
+
+        # Operational modes are static per device - cached by _cache_modes()
+        self._modes: List[dict] = []
+        self._mode_by_lower_label: Dict[str, dict] = {}
 
     async def connect(self):
         """Establish connections to Zappi and Sigenstore"""
-        self.logger.info("Connecting to MyEnergi API...")
-        connection = Connection(self.zappi_username, self.zappi_password)
-        await connection.discoverLocations()
-        self.zappi = Zappi(connection, self.zappi_serial)
+        if self._zappi_connection is None:
+            await self._init_zappi_connection()
 
         await self.zappi.refresh()
 
@@ -85,9 +155,23 @@ class BatterySitter:
             region=self.sigenergy_region
         )
         await self.sigen.async_initialize()
+        self._manual_charge_on_payload['stationId'] = self.sigen.station_id
+        self._manual_charge_off_payload['stationId'] = self.sigen.station_id
+
+        if self._manual_charge_lock is None:
+            self._manual_charge_lock = asyncio.Lock()
+
+        # Replace any session left over from a previous connection
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=4, keepalive_timeout=75, ttl_dns_cache=300
+            )
+        )
 
-        # Log available operational modes
-        modes = await self.sigen.get_operational_modes()
+        # Log available operational modes (already fetched by async_initialize())
+        modes = self._cache_modes(await self.sigen.get_operational_modes())
         self.logger.info("Available Sigenergy operational modes:")
         for mode in modes:
             self.logger.info(f"  - {mode['label']} (value: {mode['value']})")
@@ -95,13 +179,169 @@ class BatterySitter:
         current_mode = await self.sigen.get_operational_mode()
         self.logger.info(f"Current operational mode: {current_mode}")
 
-        self.last_connection_time = datetime.now()
+        self._reconnect_deadline = time.monotonic() + self.reconnect_interval
         self.logger.info("Successfully connected to both devices")
 
+    async def _init_zappi_connection(self):
+        """Create the MyEnergi connection and discover its location (done once)"""
+        self.logger.info("Connecting to MyEnergi API...")
+        connection = Connection(self.zappi_username, self.zappi_password)
+        await connection.discoverLocations()
+        self._zappi_connection = connection
+        self.zappi = Zappi(connection, self.zappi_serial)
+
+    def set_charging_power(self, charging_power: float):
+        """
+        Change the manual charge power and rebuild the prebuilt enable payload
+
+        Args:
+            charging_power: Battery charge power in kW used while the EV charges
+        """
+        self.charging_power = charging_power
+        self._manual_charge_on_power = charging_power
+        self._manual_charge_on_payload['powerLimitation'] = str(charging_power)
+
+    def _cache_modes(self, modes: Optional[List[dict]]) -> List[dict]:
+        """Store the operational modes and rebuild the label lookup"""
+        self._modes = modes or []
+        self._mode_by_lower_label = {mode['label'].lower(): mode for mode in self._modes}
+        return self._modes
+
+    async def refresh_modes(self) -> List[dict]:
+        """
+        Re-fetch the operational modes from Sigenergy and rebuild the lookup cache
+
+        Returns:
+            List of operational mode dicts with 'label' and 'value' keys
+        """
+        await self.sigen.fetch_operational_modes()
+        return self._cache_modes(self.sigen.operational_modes)
+
     async def disconnect(self):
         """Close connections"""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
         self.logger.info("Disconnected from devices")
 
+    async def start_webhook_listener(self) -> bool:
+        """
+        Start the HTTP listener that receives MyEnergi webhook notifications
+
+        Returns:
+            True if the listener is running, False if it could not be started
+        """
+        if not isinstance(self.webhook_secret, str) or not self.webhook_secret:
+            self.logger.error(
+                "Webhook listener requires polling.webhook_secret to be a non-empty string"
+            )
+            return False
+
+        self._webhook_event = asyncio.Event()
+        app = web.Application()
+        app.router.add_post('/zappi', self._handle_webhook)
+        runner = web.AppRunner(app)
+        try:
+            await runner.setup()
+            await web.TCPSite(runner, host=self.webhook_host, port=self.webhook_port).start()
+        except OSError as e:
+            self.logger.error(
+                f"Could not start webhook listener on "
+                f"{self.webhook_host}:{self.webhook_port}: {e}"
+            )
+            await runner.cleanup()
+            return False
+
+        self._webhook_runner = runner
+        self.logger.info(
+            f"Listening for MyEnergi webhooks on {self.webhook_host}:{self.webhook_port}"
+        )
+        return True
+
+    async def stop_webhook_listener(self):
+        """Stop the webhook listener if it is running"""
+        if self._webhook_runner is not None:
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
+
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        """
+        Handle a Zappi status notification
+
+        Requires the configured secret in the X-Webhook-Secret header and a
+        JSON body with 'status' and 'plug_status' using the same labels
+        pymyenergi reports (e.g. "Charging", "EV Connected").
+        """
+        secret = request.headers.get('X-Webhook-Secret', '')
+        if not hmac.compare_digest(secret.encode(), self.webhook_secret.encode()):
+            return web.Response(status=401, text="Unauthorized")
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="Invalid JSON")
+
+        if not isinstance(payload, dict) or \
+           not isinstance(payload.get('status'), str) or \
+           not isinstance(payload.get('plug_status'), str):
+            return web.Response(status=400, text="Expected 'status' and 'plug_status'")
+
+        self._webhook_charging = self._is_zappi_charging(
+            payload.get('status'), payload.get('plug_status')
+        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Webhook received: {payload}")
+        self._webhook_event.set()
+        return web.Response(status=204)
+
+    @classmethod
+    def _is_zappi_charging(cls, status: Optional[str], plug_status: Optional[str]) -> bool:
+        """Map Zappi status / plug status labels to a charging flag"""
+        return status in cls.CHARGING_STATUSES and plug_status == 'Charging'
+
+    async def wait_for_next_tick(self, interval: float):
+        """
+        Wait until the next iteration of the monitoring loop is due
+
+        In webhook mode the loop wakes as soon as a notification arrives. It
+        also wakes every interval seconds while EV charging is in progress, and
+        at least every MAX_IDLE_POLL_INTERVAL seconds otherwise, so a lost
+        notification is picked up by polling Zappi.
+
+        Args:
+            interval: Seconds until the next poll
+        """
+        if self._webhook_runner is None:
+            await self._wait_for_stop(interval)
+            return
+
+        # shutdown() also sets the webhook event so this returns promptly
+        timeout = interval if self.is_charging else self.MAX_IDLE_POLL_INTERVAL
+        try:
+            await asyncio.wait_for(self._webhook_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._webhook_event.clear()
+
+    def _get_stop_event(self) -> asyncio.Event:
+        """Return the shutdown event, creating it on first use inside the running loop"""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """
+        Sleep for up to timeout seconds, returning early if shutdown is requested
+
+        Returns:
+            True if shutdown was requested
+        """
+        try:
+            await asyncio.wait_for(self._get_stop_event().wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def get_zappi_charging_status(self) -> bool:
         """
         Check if Zappi is currently charging
@@ -112,20 +352,16 @@ class BatterySitter:
         try:
             await self.zappi.refresh()
 
-            # Status codes from pymyenergi:
-            # Paused, Charging or Completed
-            charging_statuses = ['Charging', 'Boosting']
-
-            is_charging = (
-                self.zappi.status in charging_statuses and
-                self.zappi.plug_status == 'Charging'
+            is_charging = self._is_zappi_charging(
+                self.zappi.status, self.zappi.plug_status
             )
 
-            self.logger.debug(
-                f"Zappi status: {self.zappi.status}, "
-                f"plug_status: {self.zappi.plug_status}, "
-                f"charge_mode: {self.zappi.charge_mode}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Zappi status: {self.zappi.status}, "
+                    f"plug_status: {self.zappi.plug_status}, "
+                    f"charge_mode: {self.zappi.charge_mode}"
+                )
 
             return is_charging
 
@@ -166,18 +402,17 @@ class BatterySitter:
             mode_name: Name of the mode (e.g., "Maximum Self-Powered")
         """
         try:
-            modes = await self.sigen.get_operational_modes()
-
             # Find the mode by name (case-insensitive partial match)
-            target_mode = None
-            for mode in modes:
-                if mode_name.lower() in mode['label'].lower():
-                    target_mode = mode
-                    break
+            lower_name = mode_name.lower()
+            target_mode = next(
+                (mode for label, mode in self._mode_by_lower_label.items()
+                 if lower_name in label),
+                None
+            )
 
             if not target_mode:
                 self.logger.error(f"Mode '{mode_name}' not found. Available modes:")
-                for mode in modes:
+                for mode in self._modes:
                     self.logger.error(f"  - {mode['label']}")
                 raise ValueError(f"Unknown operational mode: {mode_name}")
 
@@ -220,27 +455,33 @@ class BatterySitter:
             await self.sigen.ensure_valid_token()
             # Note: API has typo "manunal"
             url = f"{self.sigen.BASE_URL}device/energy-profile/instant/manunal"
-            payload = {
-                'enable': enable,
-                'stationId': self.sigen.station_id,
-                'mode': mode,
-                'duration': str(duration_minutes),
-                'powerLimitation': str(power_kw)
-            }
-
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.put(
+            payload = self._prebuilt_manual_charge_payload(
+                enable, duration_minutes, power_kw, mode
+            )
+            if payload is None:
+                payload = {
+                    'enable': enable,
+                    'stationId': self.sigen.station_id,
+                    'mode': mode,
+                    'duration': str(duration_minutes),
+                    'powerLimitation': str(power_kw)
+                }
+
+            async with self._manual_charge_lock:
+                async with self._http_session.put(
                     url, headers=self.sigen.headers, json=payload
                 ) as response:
                     result = await response.json()
 
                     if enable:
+                        if 200 <= response.status < 300:
+                            self._last_manual_charge_enable_ts = time.monotonic()
                         self.logger.info(
                             f"Enabled instant manual charge: "
                             f"{power_kw}kW for {duration_minutes} minutes"
                         )
                     else:
+                        self._last_manual_charge_enable_ts = None
                         self.logger.info("Disabled instant manual charge")
 
                     return result
@@ -249,44 +490,162 @@ class BatterySitter:
             self.logger.error(f"Error setting instant manual charge: {e}")
             raise
 
+    async def read_status(self) -> Tuple[bool, Optional[dict]]:
+        """
+        Read the Zappi charging status and, when needed, the battery info
+
+        Battery info only drives decisions while the EV is charging, so it is
+        skipped when the EV is unplugged and idle (unless DEBUG logging is on).
+
+        Returns:
+            Tuple of (zappi_charging, battery_info); battery_info is None if skipped
+        """
+        want_battery = (
+            self.is_charging or
+            self.logger.isEnabledFor(logging.DEBUG)
+        )
+
+        if self._webhook_charging is not None:
+            # Woken by a webhook - use its status once, timed wakes poll Zappi
+            zappi_charging = self._webhook_charging
+            self._webhook_charging = None
+        elif not want_battery and self.zappi.plug_status == self.PLUG_DISCONNECTED:
+            zappi_charging = await self.get_zappi_charging_status()
+        else:
+            # The two cloud APIs are independent - query them concurrently
+            zappi_charging, battery_info = await asyncio.gather(
+                self.get_zappi_charging_status(),
+                self.get_battery_info(),
+                return_exceptions=True
+            )
+            if isinstance(zappi_charging, BaseException):
+                self.logger.error(f"Error reading Zappi status: {zappi_charging}")
+                zappi_charging = False
+            if isinstance(battery_info, BaseException):
+                self.logger.error(f"Error reading battery info: {battery_info}")
+                battery_info = {}
+            return zappi_charging, battery_info
+
+        if want_battery or zappi_charging:
+            return zappi_charging, await self.get_battery_info()
+        return zappi_charging, None
+
+    def _prebuilt_manual_charge_payload(
+        self, enable: bool, duration_minutes: int, power_kw: float, mode: str
+    ) -> Optional[dict]:
+        """Return the prebuilt payload if the arguments match the usual on/off request"""
+        if mode != "0":
+            return None
+        if enable:
+            if duration_minutes == 30 and power_kw == self._manual_charge_on_power:
+                return self._manual_charge_on_payload
+        elif duration_minutes == 0 and power_kw == 0:
+            return self._manual_charge_off_payload
+        return None
+
+    def _manual_charge_recently_enabled(self) -> bool:
+        """Check whether a manual charge enable succeeded recently"""
+        if self._last_manual_charge_enable_ts is None:
+            return False
+        elapsed = time.monotonic() - self._last_manual_charge_enable_ts
+        return elapsed < max(self.poll_interval, self.MIN_REENABLE_INTERVAL)
+
+    async def _ensure_manual_charge_on(self, reason: str, level: int = logging.INFO) -> bool:
+        """
+        Enable instant manual charge unless one was enabled recently
+
+        Args:
+            reason: Message logged when the enable is issued
+            level: Log level for reason
+
+        Returns:
+            True if an enable request was sent
+        """
+        if self._manual_charge_recently_enabled():
+            # Give the last enable time to take effect before retrying
+            self.logger.debug(
+                "Battery not charging yet - manual charge enabled recently, waiting"
+            )
+            return False
+
+        self.logger.log(level, reason)
+        await self.set_instant_manual_charge(
+            enable=True, duration_minutes=30,
+            power_kw=self.charging_power
+        )
+        self.manual_charge_enabled = True
+        return True
+
+    async def _ensure_manual_charge_off(self, reason: str) -> bool:
+        """
+        Disable instant manual charge, but only if WE enabled it
+
+        Args:
+            reason: Message logged when the disable is issued
+
+        Returns:
+            True if a disable request was sent
+        """
+        if not self.manual_charge_enabled:
+            return False
+
+        self.logger.info(reason)
+        await self.set_instant_manual_charge(
+            enable=False, duration_minutes=0, power_kw=0
+        )
+        self.manual_charge_enabled = False
+        return True
+
     async def monitor_loop(self):
         """Main monitoring loop"""
-        self.running = True
         self.logger.info("Starting monitoring loop...")
-        self.logger.info(f"Will check status every {self.poll_interval} seconds")
+        if self._webhook_runner is not None:
+            self.logger.info(
+                f"Waiting for MyEnergi webhooks "
+                f"(polling every {self.poll_interval} seconds while charging, "
+                f"every {self.MAX_IDLE_POLL_INTERVAL} seconds otherwise)"
+            )
+        else:
+            self.logger.info(f"Will check status every {self.poll_interval} seconds")
         self.logger.info(
              f"When EV charging detected: "
              f"Enable instant manual battery charge at {self.charging_power}kW for 30min"
         )
 
-        while self.running:
+        current_interval = self.poll_interval
+        stop_event = self._get_stop_event()
+
+        while not stop_event.is_set():
             try:
                 # Periodic reconnection to refresh tokens/sessions
-                if self.last_connection_time:
-                    time_since_connection = datetime.now() - self.last_connection_time
-                    if time_since_connection >= self.reconnect_interval:
-                        self.logger.info(
-                            f"Reconnecting after {time_since_connection.total_seconds() / 3600:.1f} hours"
-                        )
-                        await self.connect()
+                if time.monotonic() >= self._reconnect_deadline:
+                    self.logger.info(
+                        f"Reconnecting after {self.reconnect_interval / 3600:.1f} hours"
+                    )
+                    await self.connect()
 
-                # Check Zappi charging status
-                zappi_charging = await self.get_zappi_charging_status()
+                # Avoid building debug f-strings when DEBUG is off
+                debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
-                # Get battery/energy info for logging
-                battery_info = await self.get_battery_info()
-                if not battery_info:
+                # Check Zappi charging status and get battery/energy info
+                zappi_charging, battery_info = await self.read_status()
+                if battery_info is None:
+                    # Skipped while idle - battery data is only used for logging
+                    battery_info = {}
+                elif not battery_info:
                     self.logger.warning(
                         "Battery info unavailable - "
                         "get_battery_info() returned empty dict"
                     )
+                # Raw values are kept for logging, numeric ones drive decisions
                 battery_soc = battery_info.get('batterySoc', 'N/A')
                 # Positive = charging, Negative = discharging
                 battery_power = battery_info.get('batteryPower', 'N/A')
+                soc = _num_or_none(battery_soc)
+                power = _num_or_none(battery_power)
 
                 # Debug log the raw values if they're not numeric
-                if not isinstance(battery_power, (int, float)) or \
-                   not isinstance(battery_soc, (int, float)):
+                if debug_enabled and (power is None or soc is None):
                     self.logger.debug(
                         f"Non-numeric battery data - "
                         f"SOC: {battery_soc} (type: {type(battery_soc).__name__}), "
@@ -295,10 +654,9 @@ class BatterySitter:
 
                 # Check if battery is already charging from another source
                 # (AI, timer, etc.)
-                battery_already_charging = (
-                    isinstance(battery_power, (int, float)) and
-                    battery_power > 0
-                )
+                battery_already_charging = power is not None and power > 0
+
+                was_charging = self.is_charging
 
                 # Handle state changes
                 if zappi_charging and not self.is_charging:
@@ -317,16 +675,11 @@ class BatterySitter:
                         self.manual_charge_enabled = False
                     else:
                         # Enable instant manual charge at 1kW for 30 minutes
-                        self.logger.info(
+                        await self._ensure_manual_charge_on(
                             f"Battery not charging - enabling instant manual "
                             f"charge ({self.charging_power}kW for 30min)"
                         )
-                        await self.set_instant_manual_charge(
-                            enable=True, duration_minutes=30,
-                            power_kw=self.charging_power
-                        )
                         self.is_charging = True
-                        self.manual_charge_enabled = True
 
                 elif not zappi_charging and self.is_charging:
                     # EV charging just stopped
@@ -336,59 +689,49 @@ class BatterySitter:
                     )
 
                     # Disable instant manual charge only if WE enabled it
-                    if self.manual_charge_enabled:
-                        self.logger.info("Disabling instant manual battery charge")
-                        await self.set_instant_manual_charge(
-                            enable=False, duration_minutes=0, power_kw=0
-                        )
-                        self.manual_charge_enabled = False
-
+                    await self._ensure_manual_charge_off(
+                        "Disabling instant manual battery charge"
+                    )
                     self.is_charging = False
 
                 elif zappi_charging and self.is_charging:
                     # EV charging continues
                     if battery_already_charging:
                         # Battery is charging (either from us or system AI/timer) - no action needed
-                        self.logger.debug(
-                            f"Status: charging EV, Battery charging "
-                            f"(SOC: {battery_soc}%, Power: {battery_power}W)"
+                        if debug_enabled:
+                            self.logger.debug(
+                                f"Status: charging EV, Battery charging "
+                                f"(SOC: {battery_soc}%, Power: {battery_power}W)"
+                            )
+                    elif not self.manual_charge_enabled:
+                        # Battery is NOT charging - enable manual charge
+                        await self._ensure_manual_charge_on(
+                            f"Battery not charging - enabling instant manual "
+                            f"charge ({self.charging_power}kW for 30min)"
                         )
                     else:
-                        # Battery is NOT charging - enable/re-enable manual charge
-                        if not self.manual_charge_enabled:
-                            self.logger.info(
-                                f"Battery not charging - enabling instant manual "
-                                f"charge ({self.charging_power}kW for 30min)"
-                            )
-                        else:
-                            # Battery stopped charging even though we enabled it
-                            # (API failure, timer expired, or SOC at 100%)
-                            # Re-enable to ensure it charges
-                            self.logger.warning(
-                                f"Battery not charging despite manual charge "
-                                f"enabled (SOC: {battery_soc}%, Power: {battery_power}W) "
-                                f"- retrying enable"
-                            )
-
-                        # Always (re-)enable when battery should be charging but isn't
-                        await self.set_instant_manual_charge(
-                            enable=True, duration_minutes=30,
-                            power_kw=self.charging_power
+                        # Battery stopped charging even though we enabled it
+                        # (API failure, timer expired, or SOC at 100%)
+                        # Re-enable to ensure it charges
+                        await self._ensure_manual_charge_on(
+                            f"Battery not charging despite manual charge "
+                            f"enabled (SOC: {battery_soc}%, Power: {battery_power}W) "
+                            f"- retrying enable",
+                            level=logging.WARNING
                         )
-                        self.manual_charge_enabled = True
 
-                else:
+                elif debug_enabled:
                     # No state change - just log status periodically
-                    if isinstance(battery_power, (int, float)):
-                        if battery_power > 0:
+                    if power is not None:
+                        if power > 0:
                             power_status = "charging"
-                        elif battery_power < 0:
+                        elif power < 0:
                             power_status = "discharging"
                         else:
                             power_status = "idle"
                         self.logger.debug(
                             f"Status: idle, Battery SOC: {battery_soc}%, "
-                            f"Battery {power_status}: {abs(battery_power)}W"
+                            f"Battery {power_status}: {abs(power)}W"
                         )
                     else:
                         self.logger.debug(
@@ -396,8 +739,17 @@ class BatterySitter:
                             f"(battery power: {battery_power})"
                         )
 
-                # Wait before next poll
-                await asyncio.sleep(self.poll_interval)
+                # Back off while the EV is unplugged, snap back on any change
+                if self.is_charging == was_charging and \
+                   self.zappi.plug_status == self.PLUG_DISCONNECTED:
+                    current_interval = min(current_interval * 2, self.MAX_IDLE_POLL_INTERVAL)
+                else:
+                    current_interval = self.poll_interval
+                if debug_enabled:
+                    self.logger.debug(f"Next status check in {current_interval} seconds")
+
+                # Wait before next poll (or webhook notification)
+                await self.wait_for_next_tick(current_interval)
 
             except KeyboardInterrupt:
                 self.logger.info("Received shutdown signal")
@@ -405,22 +757,22 @@ class BatterySitter:
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}", exc_info=True)
                 # Continue monitoring despite errors
-                await asyncio.sleep(self.poll_interval)
+                await self._wait_for_stop(self.poll_interval)
 
     async def shutdown(self):
         """Graceful shutdown - restore battery to normal operation"""
         self.logger.info("Shutting down BatterySitter...")
-        self.running = False
+        self._get_stop_event().set()
+        if self._webhook_event is not None:
+            self._webhook_event.set()
 
         # Disable instant manual charge only if WE enabled it
-        if self.manual_charge_enabled:
-            self.logger.info("Disabling instant manual charge on shutdown")
-            try:
-                await self.set_instant_manual_charge(enable=False, duration_minutes=0, power_kw=0)
-                self.manual_charge_enabled = False
-            except Exception as e:
-                self.logger.error(f"Error disabling instant manual charge: {e}")
+        try:
+            await self._ensure_manual_charge_off("Disabling instant manual charge on shutdown")
+        except Exception as e:
+            self.logger.error(f"Error disabling instant manual charge: {e}")
 
+        await self.stop_webhook_listener()
         await self.disconnect()
         self.logger.info("Shutdown complete")
 
@@ -428,25 +780,55 @@ class BatterySitter:
         """Run the battery sitter service"""
         try:
             await self.connect()
+            if self.use_webhook and not await self.start_webhook_listener():
+                self.logger.warning("Falling back to polling Zappi status")
             await self.monitor_loop()
         finally:
             await self.shutdown()
 
 
+def configure_logging(log_file: str = 'battery_sitter.log') -> logging.handlers.QueueListener:
+    """
+    Configure root logging so file/console I/O runs off the event loop thread
+
+    Records are queued by a QueueHandler and written by a background
+    QueueListener to a rotating log file and stdout.
+
+    Args:
+        log_file: Path of the log file
+
+    Returns:
+        The started QueueListener - call stop() on shutdown to flush it
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8'
+    )
+    handlers = [file_handler, logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Final formatting is done by the listener's handlers
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    # force=True: importing sigen already called basicConfig on the root logger
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
 async def main():
     """
     Main entry point - for testing only!
     In production, use run.py which loads configuration from config.json
     """
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('battery_sitter.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    listener = configure_logging()
 
     logger = logging.getLogger(__name__)
     logger.info("=" * 60)
@@ -455,16 +837,19 @@ async def main():
     logger.info("=" * 60)
 
     # Load from config.json if available, otherwise exit
-    import json
-    import os
+    try:
+        import orjson as json_parser
+    except ImportError:
+        import json as json_parser
 
     if not os.path.exists('config.json'):
         logger.error("config.json not found!")
         logger.error("Please copy config.example.json to config.json and configure it")
+        listener.stop()
         sys.exit(1)
 
-    with open('config.json', 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    with open('config.json', 'rb') as f:
+        config = json_parser.loads(f.read())
 
     sitter = BatterySitter(
         zappi_username=config['zappi']['username'],
@@ -474,7 +859,11 @@ async def main():
         sigenergy_password=config['sigenergy']['password'],
         sigenergy_region=config['sigenergy']['region'],
         poll_interval=config['polling']['interval_seconds'],
-        charging_power=config['sigenergy']['charging_power']
+        charging_power=config['sigenergy']['charging_power'],
+        use_webhook=config['polling'].get('use_webhook', False),
+        webhook_port=config['polling'].get('webhook_port', 8089),
+        webhook_host=config['polling'].get('webhook_host', '127.0.0.1'),
+        webhook_secret=config['polling'].get('webhook_secret')
     )
 
     # Handle signals for graceful shutdown
@@ -489,7 +878,10 @@ async def main():
     signal.signal(signal.SIGTERM, signal_handler)
 
     # Run the service
-    await sitter.run()
+    try:
+        await sitter.run()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
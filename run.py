@@ -7,12 +7,31 @@ import asyncio
 import logging
 import sys
 import os
-import json
+import signal
 
-from battery_sitter import BatterySitter
+from battery_sitter import BatterySitter, configure_logging
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-def load_config(config_path='config.json'):
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+CONFIG_PATH = 'config.json'
+
+
+def _read_config(config_path):
+    """Read and parse the JSON configuration file"""
+    with open(config_path, 'rb') as f:
+        return _json.loads(f.read())
+
+
+def load_config(config_path=CONFIG_PATH):
     """Load configuration from JSON file"""
     if not os.path.exists(config_path):
         print(f"ERROR: {config_path} not found!")
@@ -20,9 +39,8 @@ def load_config(config_path='config.json'):
         sys.exit(1)
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return _read_config(config_path)
+    except ValueError as e:
         print(f"ERROR: Invalid JSON in {config_path}: {e}")
         sys.exit(1)
     except Exception as e:
@@ -30,20 +48,38 @@ def load_config(config_path='config.json'):
         sys.exit(1)
 
 
+def reload_config(sitter, config_path=CONFIG_PATH):
+    """Re-read the configuration and apply polling/charging settings live"""
+    logger = logging.getLogger(__name__)
+    try:
+        config = _read_config(config_path)
+        poll_interval = config['polling']['interval_seconds']
+        charging_power = config['sigenergy']['charging_power']
+        for name, value in (('interval_seconds', poll_interval),
+                            ('charging_power', charging_power)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"{name} must be a positive number, got {value!r}")
+    except Exception as e:
+        logger.error(f"Failed to reload {config_path}, keeping current settings: {e}")
+        return
+
+    # Only apply once both values have been read and validated
+    sitter.poll_interval = poll_interval
+    sitter.set_charging_power(charging_power)
+
+    logger.info(
+        f"Reloaded {config_path}: poll interval {sitter.poll_interval}s, "
+        f"charging power {sitter.charging_power}kW"
+    )
+
+
 async def main():
     """Main entry point with configuration loaded from config.json"""
     # Load configuration
     config = load_config()
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('battery_sitter.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Configure logging (file/console writes happen on a background thread)
+    listener = configure_logging()
 
     # Suppress verbose HTTP logs from httpx
     logging.getLogger('httpx').setLevel(logging.WARNING)
@@ -62,16 +98,40 @@ async def main():
         sigenergy_password=config['sigenergy']['password'],
         sigenergy_region=config['sigenergy']['region'],
         poll_interval=config['polling']['interval_seconds'],
-        charging_power=config['sigenergy']['charging_power']
+        charging_power=config['sigenergy']['charging_power'],
+        use_webhook=config['polling'].get('use_webhook', False),
+        webhook_port=config['polling'].get('webhook_port', 8089),
+        webhook_host=config['polling'].get('webhook_host', '127.0.0.1'),
+        webhook_secret=config['polling'].get('webhook_secret')
     )
 
+    # Reload polling/charging settings on SIGHUP without reconnecting
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda *_: reload_config(sitter))
+
     # Run the service
-    await sitter.run()
+    try:
+        await sitter.run()
+    finally:
+        # Flush queued log records after shutdown has finished
+        listener.stop()
+
+
+def run_main():
+    """Run main() on uvloop when installed, otherwise the default asyncio loop"""
+    if uvloop is None or sys.platform == 'win32':
+        asyncio.run(main())
+    elif sys.version_info >= (3, 12):
+        # pylint: disable-next=unexpected-keyword-arg
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    else:
+        uvloop.install()
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main()
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e: